@@ -1,16 +1,22 @@
+import io
 import json
 import re
 import random
 import os
 import requests
 import logging
-from collections import deque
+import hashlib
+from collections import deque, OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .engine import BaseAgent, Role
 from .config import MAP_ADJACENCY
 
 
 # --- LLM Utilities ---
 
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
 def parse_llm_json(text: str, fallback: dict | None = None) -> dict:
     if text is None: return fallback or {}
     text = text.strip()
@@ -20,23 +26,34 @@ def parse_llm_json(text: str, fallback: dict | None = None) -> dict:
         pass
 
     # Match code blocks
-    match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+    match = _CODE_BLOCK_RE.search(text)
     if match:
         try:
             return json.loads(match.group(1))
         except json.JSONDecodeError:
             pass
 
-    # Match raw braces
-    match = re.search(r"\{.*\}", text, re.DOTALL)
-    if match:
+    # Outermost braces: same span as a greedy \{.*\} match, found with two C-level scans
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(match.group(0))
+            return json.loads(text[start:end + 1])
         except json.JSONDecodeError:
             pass
 
     return fallback or {}
 
+# Last identifier in the reply, ignoring trailing quotes/punctuation ("I vote player_3." -> player_3)
+_VOTE_RE = re.compile(r"([A-Za-z0-9_]+)[^A-Za-z0-9_]*$")
+
+def parse_llm_vote(text: str) -> str:
+    if not text: return "skip"
+    match = _VOTE_RE.search(text)
+    if not match: return "skip"
+    vote = match.group(1)
+    return "skip" if vote.lower() == "skip" else vote
+
 def format_observation_as_text(obs: dict) -> str:
     try:
         md = obs.get("game_metadata", {})
@@ -90,6 +107,31 @@ def format_observation_as_text(obs: dict) -> str:
         logging.error(f"Error formatting observation: {e}")
         return "Error reading observation. Check your logs."
     
+class ChatHistoryBuffer:
+    """
+    Incrementally rendered "speaker: message" transcript of the current meeting.
+    Each call only formats messages added since the previous one; the buffer
+    starts over when the observation belongs to a different round's meeting.
+    """
+    def __init__(self):
+        self._round = None
+        self._seen = 0
+        self._buf = io.StringIO()
+
+    def render(self, obs: dict) -> str:
+        chat = obs.get("chat_history", [])
+        round_number = obs.get("game_metadata", {}).get("round_number")
+        if round_number != self._round or len(chat) < self._seen:
+            self._round = round_number
+            self._seen = 0
+            self._buf = io.StringIO()
+        for m in chat[self._seen:]:
+            if self._seen:
+                self._buf.write("\n")
+            self._buf.write(f"{m['speaker']}: {m['message']}")
+            self._seen += 1
+        return self._buf.getvalue()
+
 def bfs_shortest_path(start: str, end: str, adjacency: dict) -> list[str]:
     """
     Standard BFS to find the shortest path between two rooms.
@@ -109,6 +151,55 @@ def bfs_shortest_path(start: str, end: str, adjacency: dict) -> list[str]:
                 queue.append(path + [neighbor])
     return []
 
+# --- HTTP Session ---
+
+def create_http_session(pool_connections: int = 4, pool_maxsize: int = 16) -> requests.Session:
+    """
+    Keep-alive session with connection pooling and a short retry on transient errors.
+    Every agent calls the same host hundreds of times a game, so reusing connections
+    pays the TCP/TLS handshake once instead of on every turn.
+    Only failed connects and retryable statuses are resent: a read timeout means the
+    generation may still be running (and billed), and the engine has already moved on.
+    Retry-After is ignored so the retries stay well inside the agent timeout.
+    """
+    session = requests.Session()
+    retries = Retry(total=2, read=0, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=None, raise_on_status=False, respect_retry_after_header=False)
+    session.mount("https://", HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries))
+    session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+    return session
+
+_SESSION = create_http_session()
+
+def encode_payload(data: dict) -> bytes:
+    """Compact UTF-8 request body; the session already sends the JSON Content-Type."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+class ResponseCache:
+    """
+    Small LRU of LLM replies keyed by a digest of everything that shapes the reply
+    (model, prompts, limits). Used by the wrappers' call(..., cache=True).
+    """
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+
+    @staticmethod
+    def key(*parts) -> bytes:
+        return hashlib.blake2b("\x00".join(map(str, parts)).encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> str | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: str) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 # --- OpenRouter Wrapper ---
 
 class OpenRouterWrapper:
@@ -119,13 +210,22 @@ class OpenRouterWrapper:
         self.total_completion_tokens = 0
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY environment variable not set.")
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._cache = ResponseCache()
 
-    def call(self, system_prompt: str, user_message: str, max_tokens: int = 500) -> str:
+    def call(self, system_prompt: str, user_message: str, max_tokens: int = 500, cache: bool = False) -> str:
+        """
+        With cache=True an identical earlier request is answered from memory, and
+        the request is sent at temperature 0 so the reply worth reusing is the
+        deterministic one.
+        """
+        if cache:
+            key = ResponseCache.key(self.model_name, max_tokens, system_prompt, user_message)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        
         url = "https://openrouter.ai/api/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         data = {
             "model": self.model_name,
             "messages": [
@@ -133,18 +233,21 @@ class OpenRouterWrapper:
                 {"role": "user", "content": user_message}
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.7
+            "temperature": 0.0 if cache else 0.7
         }
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = _SESSION.post(url, headers=self.headers, data=encode_payload(data), timeout=30)
             if response.status_code == 200:
-                res_json = response.json()
+                res_json = json.loads(response.content)
 
                 usage = res_json.get("usage", {})
                 self.total_prompt_tokens += usage.get("prompt_tokens", 0)
                 self.total_completion_tokens += usage.get("completion_tokens", 0)
 
-                return res_json["choices"][0]["message"]["content"]
+                content = res_json["choices"][0]["message"]["content"]
+                if cache and content:
+                    self._cache.put(key, content)
+                return content
             
             logging.error(f"OpenRouter error: {response.status_code} - {response.text}")
             return ""
@@ -164,66 +267,69 @@ class OpenRouterWrapper:
 class PersonalityAgent(BaseAgent):
     def __init__(self, personality: str = None, model_name="upstage/solar-pro-3:free"):
         self.llm = OpenRouterWrapper(model_name=model_name)
+        self._requested_personality = personality
         self.personality = personality or random.choice(AGENT_PERSONALITIES)
         self.id = ""
         self.role = ""
         self.memory = []
+        self._chat = ChatHistoryBuffer()
+        self._system_prompt = self._get_system_prompt()
 
     def on_game_start(self, config):
         self.id = config["your_id"]
         self.role = config["your_role"]
         self.game_config = config
+        # id, role and personality are fixed for the game, so the prompt is too
+        self._system_prompt = self._get_system_prompt()
 
     def _get_system_prompt(self):
-        return f"""You are playing 'Among Us' as {self.id}, a {self.role}.
+        return f"""Among Us. You are {self.id}, {self.role}.
 PERSONALITY: {self.personality}
-
-RULES:
-- Crewmates win by completing all tasks or ejecting all impostors.
-- Impostors win by killing crewmates or critical sabotage.
-- Movement takes 1 round.
-- Action Model: resolve movement -> resolve kills -> resolve tasks -> resolve reports.
-
+RULES: Crew wins by finishing tasks or ejecting impostors; impostors by kills or critical sabotage. Moves take 1 round. Order: move, kill, task, report.
 STRATEGY:
-- If Crewmate: prioritize tasks. If you see a body, report it.
-- If Impostor: you must be in the SAME room as someone to kill them. Predict their movement.
-- DISCUSSION: Be logical. If there are 4 or 5 players left, SKIPPING is dangerous. Vote for the most suspicious person.
-- GHOSTS: If you are dead, your ONLY goal is to move to your task locations and finish them.
-
-RESPONSE FORMAT:
-- During TASK phase: Respond with a JSON object like {{"action": "move", "target": "Admin"}} or {{"action": "do_task", "target": "task_id"}}.
-- During DISCUSSION: Respond with plain text conversational message.
-- During VOTING: Respond with player ID or "skip".
-"""
+- Crew: do tasks; report bodies.
+- Impostor: kill only in the SAME room; predict movement.
+- Meetings: be logical; skipping at 4-5 alive is dangerous; vote the most suspicious.
+- Ghost: move to your tasks and finish them.
+FORMAT: task phase -> JSON {{"action": ..., "target": ...}}; discussion -> plain text; vote -> player ID or "skip"."""
 
     def on_task_phase(self, obs):
-        prompt = self._get_system_prompt()
+        prompt = self._system_prompt
         obs_text = format_observation_as_text(obs)
         state_note = ""
         if "available_actions" not in obs:
-            state_note = "\nNOTE: You are a GHOST (dead). You can still help your team by moving to task locations and doing tasks. You are invisible to living players."
-        user_msg = f"CURRENT OBSERVATION:\n{obs_text}{state_note}\n\nWhat is your next action? Respond ONLY with JSON. \n- If doing a task, use the EXACT 'ID' provided.\n- If moving, pick a DIFFERENT adjacent room than your current one.\n- If Impostor and someone is alone with you, consider 'kill'."
+            state_note = "\nYou are a GHOST: invisible, still do tasks."
+        user_msg = f"{obs_text}{state_note}\nNext action as JSON only. Tasks: use the exact ID. Move: a different adjacent room. Impostor alone with someone: consider kill."
         resp = self.llm.call(prompt, user_msg)
         return parse_llm_json(resp, {"action": "wait"})
 
     def on_discussion(self, obs):
-        prompt = self._get_system_prompt()
-        obs_text = format_observation_as_text(obs)
+        prompt = self._system_prompt
         # Add chat history context
-        chat_hist = "\n".join([f"{m['speaker']}: {m['message']}" for m in obs.get("chat_history", [])])
+        chat_hist = self._chat.render(obs)
         user_msg = f"MEETING CONTEXT: {obs.get('meeting_context')}\n\nCHAT HISTORY:\n{chat_hist}\n\nIt is your turn to speak. Be concise and stay in character."
         return self.llm.call(prompt, user_msg)
 
     def on_vote(self, obs):
-        prompt = self._get_system_prompt()
-        chat_hist = "\n".join([f"{m['speaker']}: {m['message']}" for m in obs.get("chat_history", [])])
+        prompt = self._system_prompt
+        chat_hist = self._chat.render(obs)
         user_msg = f"CHAT HISTORY:\n{chat_hist}\n\nWho do you vote for? Respond with Player ID or 'skip'."
-        resp = self.llm.call(prompt, user_msg)
-        # Clean up response to just the ID
-        return resp.strip().split()[-1].replace('"', '').replace("'", "")
+        return parse_llm_vote(self.llm.call(prompt, user_msg))
 
     def on_game_end(self, result): pass
 
+    def reset(self):
+        self.id = ""
+        self.role = ""
+        self.memory = []
+        self._chat = ChatHistoryBuffer()
+        # A fresh instance would draw a new personality and start its token count at zero
+        self.personality = self._requested_personality or random.choice(AGENT_PERSONALITIES)
+        self.llm.total_prompt_tokens = 0
+        self.llm.total_completion_tokens = 0
+        self.game_config = {}
+        self._system_prompt = self._get_system_prompt()
+
 # --- Personalities ---
 
 AGENT_PERSONALITIES = [
@@ -248,6 +354,7 @@ class RandomBot(BaseAgent):
     def on_discussion(self, obs): return "I saw nothing."
     def on_vote(self, obs): return "skip"
     def on_game_end(self, result): pass
+    def reset(self): pass
 
 class RuleBasedBot(BaseAgent):
     def on_game_start(self, config):
@@ -263,4 +370,5 @@ class RuleBasedBot(BaseAgent):
         return {"action": "move", "target": random.choice(adj)} if adj else {"action": "wait"}
     def on_discussion(self, obs): return "I was doing tasks."
     def on_vote(self, obs): return "skip"
-    def on_game_end(self, result): pass
\ No newline at end of file
+    def on_game_end(self, result): pass
+    def reset(self): pass
\ No newline at end of file
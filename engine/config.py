@@ -71,6 +71,10 @@ TASK_POOL: list[dict] = [
     {"name": "Check Security",     "location": "Security",       "required": 2, "visual": False},
 ]
 
+# Split once at import; setup_game copies these per crewmate instead of re-filtering TASK_POOL
+VISUAL_TASK_POOL: tuple[dict, ...] = tuple(t for t in TASK_POOL if t["visual"])
+NORMAL_TASK_POOL: tuple[dict, ...] = tuple(t for t in TASK_POOL if not t["visual"])
+
 SABOTAGE_DEFINITIONS: dict[str, dict] = {
     "reactor": {"fix_locations": {"Reactor": 4},        "critical": True},
     "o2":      {"fix_locations": {"O2": 2, "Admin": 2}, "critical": True},
@@ -3,7 +3,10 @@ from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from typing import Any
 
-from .config import GameConfig
+from .config import (
+    GameConfig, MAP_ADJACENCY, ALL_ROOMS, SABOTAGE_DEFINITIONS, TASK_POOL,
+    VISUAL_TASK_POOL, NORMAL_TASK_POOL, VALID_ACTIONS,
+)
 
 class Role(Enum):
     CREWMATE = "crewmate"
@@ -21,7 +24,7 @@ class SabotageType(Enum):
     LIGHTS = "lights"
     COMMS = "comms"
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     id: str
     role: Role
@@ -32,7 +35,7 @@ class Player:
     kill_cooldown: int = 0
     last_action: str = "wait"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     task_id: str
     name: str
@@ -45,7 +48,7 @@ class Task:
     def completed(self) -> bool:
         return self.progress >= self.required
 
-@dataclass
+@dataclass(slots=True)
 class ActiveSabotage:
     type: SabotageType
     critical: bool
@@ -53,7 +56,7 @@ class ActiveSabotage:
     fix_progress: dict[str, int]
     fix_required: dict[str, int]
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult:
     action: str
     success: bool
@@ -110,6 +113,14 @@ class BaseAgent(ABC):
     def on_game_end(self, result: dict) -> None:
         pass
 
+    def reset(self) -> None:
+        """
+        Optional. Tournaments reuse an instance for later games only if its class
+        overrides this; otherwise every game gets a fresh one. An override must clear
+        ALL per-game state (memory, chat logs, plans), or it leaks into the next game.
+        """
+        pass
+
 import copy
 
 class ObservationGenerator:
@@ -135,7 +146,6 @@ class ObservationGenerator:
             ]
             bodies_present = [b["player_id"] for b in self.state.bodies if b["location"] == player.location]
         
-        from .config import MAP_ADJACENCY
         adjacent_rooms = MAP_ADJACENCY.get(player.location, [])
 
         events_last_round = self.state.events.get(player_id, [])
@@ -311,7 +321,6 @@ class ObservationGenerator:
         if player.role == Role.IMPOSTOR:
             impostor_teammates = [p.id for p in self.state.players.values() if p.role == Role.IMPOSTOR and p.id != player_id]
         
-        from .config import MAP_ADJACENCY, ALL_ROOMS
         return {
             "game_id": "game",
             "your_id": player_id,
@@ -415,16 +424,19 @@ class ActionResolver:
                 moves.append((pid, self.state.players[pid].location, action.get("target")))
                 self.state.players[pid].last_action = "moving"
         
+        # Only living players who stayed put see others leave or arrive
+        movers = {m[0] for m in moves}
+        watchers = [p for p in self.state.players.values() if p.alive and p.id not in movers]
         for pid, origin, target in moves:
             mover = self.state.players[pid]
-            self.state.players[pid].location = target
-            for other_p in self.state.players.values():
-                if other_p.id != pid and other_p.alive:
-                    if mover.alive: # Ghosts are invisible
-                        if other_p.location == origin and other_p.id not in [m[0] for m in moves]:
-                            self.state.events[other_p.id].append(f"{pid} left toward {target}")
-                        elif other_p.location == target and other_p.id not in [m[0] for m in moves]:
-                            self.state.events[other_p.id].append(f"{pid} arrived from {origin}")
+            mover.location = target
+            if not mover.alive: # Ghosts are invisible
+                continue
+            for other_p in watchers:
+                if other_p.location == origin:
+                    self.state.events[other_p.id].append(f"{pid} left toward {target}")
+                elif other_p.location == target:
+                    self.state.events[other_p.id].append(f"{pid} arrived from {origin}")
 
         for i, (pid1, orig1, tgt1) in enumerate(moves):
             for pid2, orig2, tgt2 in moves[i+1:]:
@@ -520,7 +532,6 @@ class ActionResolver:
         if sabotages and self.state.sabotage is None:
             pid = sabotages[0]
             sab_name = validated_actions[pid].get("target")
-            from .config import SABOTAGE_DEFINITIONS
             if sab_name in SABOTAGE_DEFINITIONS:
                 sdef = SABOTAGE_DEFINITIONS[sab_name]
                 sab_type = SabotageType(sab_name)
@@ -554,7 +565,6 @@ class ActionResolver:
         # Step 10: RESOLVE ADMIN TABLE
         admin_users = [pid for pid, act in validated_actions.items() if act.get("action") == "use_admin"]
         if admin_users:
-            from .config import MAP_ADJACENCY
             counts = {r: 0 for r in MAP_ADJACENCY.keys()}
             for p in self.state.players.values():
                 if p.alive:
@@ -620,7 +630,6 @@ class ActionResolver:
             
         if not p.alive:
             if act == "move":
-                from .config import MAP_ADJACENCY
                 if action.get("target") in MAP_ADJACENCY.get(p.location, []):
                     return ActionResult(act, True)
                 return ActionResult(act, False, "Invalid move target")
@@ -632,7 +641,6 @@ class ActionResolver:
                 return ActionResult(act, False, "Invalid task or location")
             return ActionResult(act, False, "Ghosts can only move or do tasks")
 
-        from .config import MAP_ADJACENCY, SABOTAGE_DEFINITIONS
         if act == "move":
             if action.get("target") in MAP_ADJACENCY.get(p.location, []):
                 return ActionResult(act, True)
@@ -737,8 +745,9 @@ class ActionResolver:
         return False
 
 import random
+import time
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 import logging
 
 class GameEngine:
@@ -749,9 +758,18 @@ class GameEngine:
         self.obs = None
         self.resolver = None
         self.verbose = False
+        self._executor = None
+        # Each player's latest agent call; a new one is only started once it has finished
+        self._pending_calls: dict[str, Future] = {}
+        # Players with a call still running after its timeout; their agents may be mid-update
+        self.timed_out_players: set[str] = set()
 
     def setup_game(self, forced_roles: dict[str, Role] | None = None) -> None:
         self.config.validate()
+        # Agent calls run on a pool of reusable threads for the whole game. Each agent
+        # has at most one call in flight, so one thread per agent is enough.
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.agents)), thread_name_prefix="agent")
+        self._pending_calls = {}
         
         # Assign Roles
         player_ids = list(self.agents.keys())
@@ -776,11 +794,10 @@ class GameEngine:
             self.state.players[pid] = p
 
         # Assign Tasks
-        from .config import TASK_POOL
         for pid, p in self.state.players.items():
             if p.role == Role.CREWMATE:
-                visual_pool = [t for t in TASK_POOL if t["visual"]]
-                normal_pool = [t for t in TASK_POOL if not t["visual"]]
+                visual_pool = list(VISUAL_TASK_POOL)
+                normal_pool = list(NORMAL_TASK_POOL)
                 
                 tasks = []
                 # Pick visual
@@ -828,8 +845,7 @@ class GameEngine:
         self.obs = ObservationGenerator(self.state)
         self.resolver = ActionResolver(self.state)
 
-        for pid, agent in self.agents.items():
-            self._call_agent(pid, "on_game_start", self.obs.generate_game_start_info(pid))
+        self._call_agents("on_game_start", {pid: self.obs.generate_game_start_info(pid) for pid in self.agents})
 
     def run(self, forced_roles: dict[str, Role] | None = None, verbose: bool = False) -> dict:
         self.setup_game(forced_roles)
@@ -852,8 +868,9 @@ class GameEngine:
         if self.verbose:
             print(f"\n[GAME OVER] Winner: {result['winner']} | Cause: {result['cause']}")
             
-        for pid, agent in self.agents.items():
-            self._call_agent(pid, "on_game_end", self.obs.generate_game_end_info(pid))
+        self._call_agents("on_game_end", {pid: self.obs.generate_game_end_info(pid) for pid in self.agents})
+        # Don't wait on agents that are still stuck in a timed-out call
+        self._executor.shutdown(wait=False, cancel_futures=True)
         return result
 
     def _run_task_round(self) -> None:
@@ -878,12 +895,8 @@ class GameEngine:
             else:
                 observations[pid] = copy.deepcopy(self.obs.generate_ghost_observation(pid))
 
-        actions = {}
-        with ThreadPoolExecutor(max_workers=max(1, len(acting_players))) as pool:
-            futures = {pid: pool.submit(self._call_agent, pid, "on_task_phase", observations[pid]) for pid in acting_players}
-            for pid, f in futures.items():
-                raw = f.result()
-                actions[pid] = self._sanitize_action(raw)
+        raw_actions = self._call_agents("on_task_phase", observations)
+        actions = {pid: self._sanitize_action(raw) for pid, raw in raw_actions.items()}
 
         if self.verbose:
             print(f"\n--- Round {self.state.round_number + 1} ---")
@@ -933,12 +946,8 @@ class GameEngine:
         living_players = [p for p in self.state.players.values() if p.alive]
         observations = {p.id: copy.deepcopy(self.obs.generate_voting_observation(p.id)) for p in living_players}
         
-        votes = {}
-        with ThreadPoolExecutor(max_workers=max(1, len(living_players))) as pool:
-            futures = {pid: pool.submit(self._call_agent, pid, "on_vote", observations[pid]) for pid in observations.keys()}
-            for pid, f in futures.items():
-                raw_vote = f.result()
-                votes[pid] = self._sanitize_vote(raw_vote, living_players)
+        raw_votes = self._call_agents("on_vote", observations)
+        votes = {pid: self._sanitize_vote(raw_vote, living_players) for pid, raw_vote in raw_votes.items()}
 
         tally = Counter(votes.values())
         elected = None
@@ -998,23 +1007,61 @@ class GameEngine:
         self.state.admin_table_user = None
         self.state.phase = Phase.TASK
 
+    def _submit_agent_call(self, player_id: str, method: str, *args) -> Future | None:
+        """
+        Starts an agent call, unless that agent is still running one that timed out.
+        Agents are not thread-safe, so each must see at most one call at a time.
+        """
+        pending = self._pending_calls.get(player_id)
+        if pending is not None and not pending.done():
+            logging.warning(f"{player_id} is still busy; skipping {method}")
+            return None
+        future = self._executor.submit(getattr(self.agents[player_id], method), *args)
+        self._pending_calls[player_id] = future
+        return future
+
     def _call_agent(self, player_id: str, method: str, *args) -> Any:
-        agent = self.agents[player_id]
-        func = getattr(agent, method)
+        future = self._submit_agent_call(player_id, method, *args)
+        if future is None:
+            return None
         try:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(func, *args)
-                result = future.result(timeout=self.config.agent_timeout_seconds)
-            return result
+            return future.result(timeout=self.config.agent_timeout_seconds)
         except TimeoutError:
+            # Drops the call if it never started; a running one is left to finish
+            future.cancel()
             logging.warning(f"{player_id} timed out on {method}")
+            self.timed_out_players.add(player_id)
             return None
         except Exception as e:
             logging.warning(f"{player_id} raised {e} on {method}")
             return None
 
+    def _call_agents(self, method: str, args_by_player: dict[str, Any]) -> dict[str, Any]:
+        """
+        Fans one phase's calls out to every listed agent at once, so the phase waits
+        for the slowest agent rather than the sum of all of them. The calls share a
+        single deadline; late, busy or failing agents get None, as with _call_agent.
+        """
+        futures = {pid: self._submit_agent_call(pid, method, arg) for pid, arg in args_by_player.items()}
+        deadline = time.monotonic() + self.config.agent_timeout_seconds
+        results = {}
+        for pid, future in futures.items():
+            if future is None:
+                results[pid] = None
+                continue
+            try:
+                results[pid] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except TimeoutError:
+                future.cancel()
+                logging.warning(f"{pid} timed out on {method}")
+                self.timed_out_players.add(pid)
+                results[pid] = None
+            except Exception as e:
+                logging.warning(f"{pid} raised {e} on {method}")
+                results[pid] = None
+        return results
+
     def _sanitize_action(self, raw: Any) -> dict:
-        from .config import VALID_ACTIONS
         if not isinstance(raw, dict) or "action" not in raw:
             return {"action": "wait"}
         if raw["action"] not in VALID_ACTIONS:
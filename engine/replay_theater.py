@@ -68,7 +68,19 @@ class ReplayTheater:
         self.font_small = pygame.font.SysFont("Consolas", 14)
         self.font_ui = pygame.font.SysFont("Segoe UI", 16)
         
+        # Cached surfaces are converted to the display format once so blits skip per-pixel conversion
+        self._meeting_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._meeting_overlay.fill((0, 0, 0, 230))
+        self._room_labels = {name: self.font_small.render(name.upper(), True, COLORS["accent"]).convert_alpha() for name in ROOM_POSITIONS}
+        self._body_mark = self.font_small.render("!", True, COLORS["white"]).convert_alpha()
+        self._ui_title = self.font_main.render("MISSION LOG", True, COLORS["accent"]).convert_alpha()
+        self._ui_hint = self.font_small.render("SPACE: Play/Pause | LEFT/RIGHT: Seek | +/-: Speed", True, (100, 100, 100)).convert_alpha()
+        self._meeting_surf_cache = {}
+        self._sab_rooms_by_round = {}
+        self._bodies_by_room_by_round = {}
         self.load_log(log_path)
+        self._pid_color = {pid: COLORS["crewmate"] if role == "crewmate" else COLORS["impostor"] for pid, role in self.all_roles.items()}
+        self._pid_labels = {pid: self.font_small.render(pid, True, COLORS["white"]).convert_alpha() for pid in self.all_roles}
         
         self.current_round_idx = 0
         self.total_rounds = len(self.game_log)
@@ -81,6 +93,7 @@ class ReplayTheater:
         self.target_positions = {}
         
         self.running = True
+        self._dirty = True
         self.init_positions()
 
     def load_log(self, path):
@@ -89,11 +102,33 @@ class ReplayTheater:
         self.game_log = data.get("game_log", [])
         self.all_roles = data.get("all_roles", {})
         self.meeting_history = data.get("meeting_history", [])
+        self._meetings_by_round = {m["round_called"]: m for m in reversed(self.meeting_history)}
+        for m in self.meeting_history:
+            for msg in m.get("transcript", []):
+                msg['_display'] = msg['message'][:100]
         self.winner = data.get("winner")
         self.cause = data.get("cause")
+        self._build_state_cache()
+
+    def _build_state_cache(self):
+        # Consecutive rounds repeat most of their state, so unchanged fields (or whole
+        # states) share the previous round's objects instead of keeping parsed copies.
+        self._state_cache = []
+        prev = {}
+        for entry in self.game_log:
+            state = entry.get("state", {})
+            if state == prev:
+                state = prev
+            else:
+                state = {k: prev[k] if k in prev and prev[k] == v else v for k, v in state.items()}
+            entry["state"] = state
+            self._state_cache.append(state)
+            prev = state
 
     def init_positions(self):
-        state = self.game_log[0].get("state", {})
+        state = self._state_cache[0]
+        self._alive_set = set(state.get("alive_players", []))
+        self._index_round(0)
         locs = state.get("player_locations", {})
         for pid, room in locs.items():
             self.prev_positions[pid] = ROOM_POSITIONS[room]
@@ -101,7 +136,9 @@ class ReplayTheater:
 
     def update_animation_targets(self):
         self.prev_positions = self.target_positions.copy()
-        state = self.game_log[self.current_round_idx].get("state", {})
+        state = self._state_cache[self.current_round_idx]
+        self._alive_set = set(state.get("alive_players", []))
+        self._index_round(self.current_round_idx)
         locs = state.get("player_locations", {})
         for pid, room in locs.items():
             base_pos = ROOM_POSITIONS[room]
@@ -110,6 +147,16 @@ class ReplayTheater:
             offset_y = (idx // 3) * 25 + 20
             self.target_positions[pid] = (base_pos[0] + offset_x, base_pos[1] + offset_y)
         self.player_lerp = 0.0
+        self._dirty = True
+
+    def _index_round(self, idx):
+        if idx in self._sab_rooms_by_round: return
+        state = self._state_cache[idx]
+        self._sab_rooms_by_round[idx] = frozenset((state.get("sabotage") or {}).get("fix_progress", {}).keys())
+        bodies = {}
+        for b in state.get("bodies", []):
+            bodies[b["location"]] = bodies.get(b["location"], 0) + 1
+        self._bodies_by_room_by_round[idx] = bodies
 
     def draw_rounded_rect(self, rect, color, radius=10, width=0):
         pygame.draw.rect(self.screen, color, rect, width, border_radius=radius)
@@ -120,9 +167,8 @@ class ReplayTheater:
             for n in neighbors:
                 pygame.draw.line(self.screen, COLORS["border"], start, ROOM_POSITIONS[n], 2)
 
-        state = self.game_log[self.current_round_idx].get("state", {})
-        sab = state.get("sabotage")
-        active_sab_rooms = sab.get("fix_progress", {}).keys() if sab else []
+        active_sab_rooms = self._sab_rooms_by_round[self.current_round_idx]
+        bodies_by_room = self._bodies_by_room_by_round[self.current_round_idx]
 
         for name, pos in ROOM_POSITIONS.items():
             rect = pygame.Rect(pos[0]-70, pos[1]-40, 140, 80)
@@ -130,37 +176,32 @@ class ReplayTheater:
                 pygame.draw.rect(self.screen, COLORS["sabotage"], rect.inflate(10, 10), 2, border_radius=12)
             self.draw_rounded_rect(rect, COLORS["panel"])
             self.draw_rounded_rect(rect, COLORS["border"], width=2)
-            text = self.font_small.render(name.upper(), True, COLORS["accent"])
+            text = self._room_labels[name]
             self.screen.blit(text, (pos[0] - text.get_width()//2, pos[1] - 30))
-            bodies = [b for b in state.get("bodies", []) if b["location"] == name]
-            if bodies:
+            if bodies_by_room.get(name, 0):
                 pygame.draw.circle(self.screen, COLORS["body"], (pos[0], pos[1] + 15), 10)
-                mark = self.font_small.render("!", True, COLORS["white"])
-                self.screen.blit(mark, (pos[0]-3, pos[1]+7))
+                self.screen.blit(self._body_mark, (pos[0]-3, pos[1]+7))
 
     def draw_players(self):
-        state = self.game_log[self.current_round_idx].get("state", {})
-        alive_players = state.get("alive_players", [])
         for pid in self.target_positions.keys():
             p1 = self.prev_positions.get(pid, self.target_positions[pid])
             p2 = self.target_positions[pid]
             curr_x = p1[0] + (p2[0] - p1[0]) * self.player_lerp
             curr_y = p1[1] + (p2[1] - p1[1]) * self.player_lerp
-            color = COLORS["crewmate"] if self.all_roles.get(pid) == "crewmate" else COLORS["impostor"]
-            is_alive = pid in alive_players
+            color = self._pid_color.get(pid, COLORS["impostor"])
+            is_alive = pid in self._alive_set
             draw_color = color if is_alive else COLORS["dead"]
             pygame.draw.rect(self.screen, draw_color, (curr_x-18, curr_y-8, 10, 16))
             pygame.draw.circle(self.screen, draw_color, (int(curr_x), int(curr_y)), 12)
             pygame.draw.circle(self.screen, COLORS["white"] if is_alive else (100,100,100), (int(curr_x), int(curr_y)), 12, 2)
-            lbl = self.font_small.render(pid, True, COLORS["white"])
+            lbl = self._pid_labels.get(pid) or self.font_small.render(pid, True, COLORS["white"])
             self.screen.blit(lbl, (curr_x - lbl.get_width()//2, curr_y + 15))
 
     def draw_ui(self):
         panel_rect = pygame.Rect(SCREEN_WIDTH - 300, 0, 300, SCREEN_HEIGHT)
         pygame.draw.rect(self.screen, COLORS["panel"], panel_rect)
         pygame.draw.line(self.screen, COLORS["border"], (SCREEN_WIDTH-300, 0), (SCREEN_WIDTH-300, SCREEN_HEIGHT), 2)
-        title = self.font_main.render("MISSION LOG", True, COLORS["accent"])
-        self.screen.blit(title, (SCREEN_WIDTH - 280, 20))
+        self.screen.blit(self._ui_title, (SCREEN_WIDTH - 280, 20))
         r_num = self.game_log[self.current_round_idx].get("round", self.current_round_idx + 1)
         rnd_text = self.font_main.render(f"ROUND {r_num:02d}", True, COLORS["white"])
         self.screen.blit(rnd_text, (20, 20))
@@ -175,31 +216,37 @@ class ReplayTheater:
             self.screen.blit(txt, (SCREEN_WIDTH - 280, y_off))
             y_off += 20
             if y_off > SCREEN_HEIGHT - 50: break
-        hint = self.font_small.render("SPACE: Play/Pause | LEFT/RIGHT: Seek | +/-: Speed", True, (100, 100, 100))
-        self.screen.blit(hint, (20, SCREEN_HEIGHT - 30))
+        self.screen.blit(self._ui_hint, (20, SCREEN_HEIGHT - 30))
 
     def draw_meeting(self, meeting):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 230))
-        self.screen.blit(overlay, (0,0))
+        self.screen.blit(self._meeting_overlay, (0,0))
+        r_num = meeting['round_called']
+        if r_num not in self._meeting_surf_cache:
+            self._meeting_surf_cache[r_num] = self._render_meeting(meeting)
+        self.screen.blit(self._meeting_surf_cache[r_num], (0,0))
+
+    def _render_meeting(self, meeting):
+        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
         title = self.font_main.render(f"--- EMERGENCY MEETING: ROUND {meeting['round_called']} ---", True, COLORS["impostor"])
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
+        surf.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         y = 110
         transcript = meeting.get("transcript", [])
         # Show more messages (up to 18)
         for msg in transcript[-18:]:
             color = COLORS["crewmate"] if self.all_roles.get(msg['speaker']) == "crewmate" else COLORS["impostor"]
-            txt = self.font_small.render(f"{msg['speaker']}: {msg['message'][:100]}", True, color)
-            self.screen.blit(txt, (SCREEN_WIDTH//2 - 500, y))
+            txt = self.font_small.render(f"{msg['speaker']}: {msg['_display']}", True, color)
+            surf.blit(txt, (SCREEN_WIDTH//2 - 500, y))
             y += 22
         res_text = f"RESULT: {meeting['voted_out']} EJECTED ({meeting.get('role_revealed')})" if meeting['voted_out'] else "RESULT: SKIP"
         res_render = self.font_main.render(res_text, True, COLORS["sabotage"])
-        self.screen.blit(res_render, (SCREEN_WIDTH//2 - res_render.get_width()//2, SCREEN_HEIGHT - 80))
+        surf.blit(res_render, (SCREEN_WIDTH//2 - res_render.get_width()//2, SCREEN_HEIGHT - 80))
+        return surf
 
     def run_theater(self):
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
             for event in pygame.event.get():
+                self._dirty = True
                 if event.type == pygame.QUIT: self.running = False
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE: self.is_playing = not self.is_playing
@@ -212,6 +259,7 @@ class ReplayTheater:
                     if event.key == pygame.K_EQUALS: self.play_speed = max(0.1, self.play_speed - 0.2)
                     if event.key == pygame.K_MINUS: self.play_speed = min(3.0, self.play_speed + 0.2)
             if self.is_playing:
+                if self.player_lerp < 1.0: self._dirty = True
                 self.player_lerp = min(1.0, self.player_lerp + dt * (1.0 / self.play_speed))
                 if self.player_lerp >= 1.0:
                     if time.time() - self.last_round_time > self.play_speed:
@@ -220,16 +268,20 @@ class ReplayTheater:
                             self.update_animation_targets()
                             self.last_round_time = time.time()
                         else: self.is_playing = False
+            r_num = self.game_log[self.current_round_idx].get("round", self.current_round_idx + 1)
+            meeting = self._meetings_by_round.get(r_num)
+            show_meeting = meeting and self.player_lerp >= 1.0
+            if show_meeting and self.is_playing: self.last_round_time = time.time() + 1.5
+            # Nothing moved and no input arrived: the last flipped frame is still correct.
+            if not self._dirty: continue
             self.screen.fill(COLORS["space"])
             self.draw_map()
             self.draw_players()
             self.draw_ui()
-            r_num = self.game_log[self.current_round_idx].get("round", self.current_round_idx + 1)
-            meeting = next((m for m in self.meeting_history if m["round_called"] == r_num), None)
-            if meeting and self.player_lerp >= 1.0:
+            if show_meeting:
                 self.draw_meeting(meeting)
-                if self.is_playing: self.last_round_time = time.time() + 1.5 
             pygame.display.flip()
+            self._dirty = False
         pygame.quit()
 
 if __name__ == "__main__":
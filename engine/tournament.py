@@ -1,14 +1,31 @@
+import heapq
 import json
+import math
+import os
+import logging
+import queue
+import threading
+import sys
 import random
+import importlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from math import ceil
 
 from .config import GameConfig
-from .engine import GameEngine, Role
+from .engine import GameEngine, BaseAgent, Role
 from .agents import RuleBasedBot
 
+_LN10_OVER_400 = math.log(10) / 400.0
+
+# Team name for the rule-based bots that fill empty seats; never rated
+RULE_BASED_BOT_TEAM = "__RuleBasedBot__"
+_IMPOSTOR = Role.IMPOSTOR.value
+
 def compute_elo_delta(own_rating: float, opp_avg_rating: float, won: bool, k: int = 16) -> float:
-    expected = 1.0 / (1.0 + 10 ** ((opp_avg_rating - own_rating) / 400.0))
+    # 10 ** (d / 400) written as exp(d * ln10 / 400): one multiply and a C call, no pow dispatch
+    expected = 1.0 / (1.0 + math.exp((opp_avg_rating - own_rating) * _LN10_OVER_400))
     actual = 1.0 if won else 0.0
     return k * (actual - expected)
 
@@ -20,15 +37,126 @@ def _empty_stats():
         "tasks_completed": 0, "survival_count": 0
     }
 
+# Per-process state for _run_single_game, set by _init_worker in each pool worker.
+# Includes the RULE_BASED_BOT_TEAM filler so every seat is a single lookup.
+_worker_agent_classes: dict[str, type] = {}
+_worker_config: GameConfig | None = None
+# Finished agents kept for reuse, by team; only classes that override BaseAgent.reset
+_worker_agent_pool: dict[str, list[BaseAgent]] = {}
+
+def _class_ref(cls: type) -> tuple[str, str | None, str]:
+    """(module, source file, qualname) for a class, so workers can re-import it by path."""
+    module = sys.modules.get(cls.__module__)
+    ref = (cls.__module__, getattr(module, "__file__", None), cls.__qualname__)
+    try:
+        importable = "<locals>" not in cls.__qualname__ and _resolve_class_ref(ref) is cls
+    except Exception:
+        importable = False
+    if not importable:
+        raise ValueError(f"Agent class {cls.__module__}.{cls.__qualname__} cannot be re-imported by worker "
+                         f"processes; define it at module level or run the tournament with processes=1")
+    return ref
+
+def _resolve_class_ref(ref: tuple[str, str | None, str]) -> type:
+    module_name, file_path, qualname = ref
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            # Agents loaded straight from a .py file are not importable by name in a fresh worker
+            spec = importlib.util.spec_from_file_location(module_name, file_path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+    obj = module
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+def _init_worker(agent_classes: dict[str, type], config: GameConfig) -> None:
+    global _worker_agent_classes, _worker_config
+    _worker_agent_classes = dict(agent_classes)
+    _worker_agent_classes[RULE_BASED_BOT_TEAM] = RuleBasedBot
+    _worker_agent_pool.clear()
+    _worker_config = config
+
+def _init_pool_worker(agent_refs: dict[str, tuple[str, str | None, str]], config: GameConfig) -> None:
+    _init_worker({team: _resolve_class_ref(ref) for team, ref in agent_refs.items()}, config)
+
+def _run_single_game(lobby_setup: dict) -> dict:
+    agents = {}
+    team_mapping = {}
+    forced_roles = {}
+    
+    agent_classes = _worker_agent_classes
+    for pid, (team_name, role) in lobby_setup.items():
+        pooled = _worker_agent_pool.get(team_name)
+        agents[pid] = pooled.pop() if pooled else agent_classes[team_name]()
+        team_mapping[pid] = team_name
+        forced_roles[pid] = role
+        
+    engine = GameEngine(_worker_config, agents)
+    result = engine.run(forced_roles=forced_roles)
+    result["team_mapping"] = team_mapping
+    
+    for pid, agent in agents.items():
+        # A timed-out call may still be running on this agent, so it is not reused
+        if type(agent).reset is BaseAgent.reset or pid in engine.timed_out_players:
+            continue
+        try:
+            agent.reset()
+        except Exception as e:
+            logging.warning(f"{pid} raised {e} on reset")
+            continue
+        _worker_agent_pool.setdefault(team_mapping[pid], []).append(agent)
+    return result
+
+_WINNING_ROLE = {"crewmates": Role.CREWMATE.value, "impostors": Role.IMPOSTOR.value}
+
+def _player_outcomes(result: dict, team_mapping: dict) -> list[tuple[str, str, bool]]:
+    """
+    Flattens a finished game into (team, role, won) for every non-bot seat.
+    Computed once per game and shared by the Elo and stats updates.
+    """
+    # A seat won iff its role is the winning side's role: one comparison per seat
+    winning_role = _WINNING_ROLE.get(result["winner"])
+    roles = result["all_roles"]
+    outcomes = []
+    for pid, team in team_mapping.items():
+        if team == RULE_BASED_BOT_TEAM: continue
+        role = roles[pid]
+        outcomes.append((team, role, role == winning_role))
+    return outcomes
+
+def _write_game_log(log_path: Path, result: dict) -> None:
+    # json.dumps without indent goes through the C encoder; indent forces the pure-Python one.
+    # One ASCII-escaped file per game keeps logs loadable by the visualizer and replay
+    # theater, which open them with the platform default encoding.
+    log_path.write_text(json.dumps(result, separators=(",", ":")), encoding="utf-8")
+
+def _log_writer(log_queue: queue.Queue, failures: list[tuple[Path, Exception]]) -> None:
+    # A bad log must not stop the thread, or every later log would be dropped silently
+    while (item := log_queue.get()) is not None:
+        log_path, result = item
+        try:
+            _write_game_log(log_path, result)
+        except Exception as e:
+            logging.error(f"Failed to write {log_path}: {e!r}")
+            failures.append((log_path, e))
+
 class TournamentRunner:
-    def __init__(self, agent_classes: dict[str, type], config: GameConfig, games_per_team: int = 20, log_dir: str = "game_logs"):
+    def __init__(self, agent_classes: dict[str, type], config: GameConfig, games_per_team: int = 20, log_dir: str = "game_logs", processes: int | None = None):
         self.agent_classes = agent_classes
         self.config = config
         self.games_per_team = games_per_team
         self.log_dir = Path(log_dir)
+        self.processes = processes
         self.elo = {team: 1200.0 for team in agent_classes}
         self.stats = {team: _empty_stats() for team in agent_classes}
         self.game_results = []
+        # Full standings, rebuilt lazily after Elo/stats change
+        self._standings_cache: list[dict] | None = None
 
     def generate_balanced_matchups(self) -> list[dict]:
         """
@@ -44,33 +172,33 @@ class TournamentRunner:
         imp_per_team = ceil(self.games_per_team * (self.config.num_impostors / self.config.num_players))
         crew_per_team = self.games_per_team - imp_per_team
         
-        role_queues = {
-            Role.IMPOSTOR: teams * imp_per_team,
-            Role.CREWMATE: teams * crew_per_team
-        }
-        random.shuffle(role_queues[Role.IMPOSTOR])
-        random.shuffle(role_queues[Role.CREWMATE])
+        imp_pool = teams * imp_per_team
+        crew_pool = teams * crew_per_team
+        random.shuffle(imp_pool)
+        random.shuffle(crew_pool)
+
+        num_imp = self.config.num_impostors
+        num_crew = self.config.num_players - num_imp
+        num_games = max(ceil(len(imp_pool) / num_imp), ceil(len(crew_pool) / num_crew))
+        # Pad the pools so the last lobby's empty seats go to rule-based bots
+        imp_pool += [RULE_BASED_BOT_TEAM] * (num_games * num_imp - len(imp_pool))
+        crew_pool += [RULE_BASED_BOT_TEAM] * (num_games * num_crew - len(crew_pool))
+        
+        # Seat ids are the same every game: impostors take the first num_imp seats
+        imp_pids = [f"player_{j}" for j in range(num_imp)]
+        crew_pids = [f"player_{j}" for j in range(num_imp, self.config.num_players)]
         
         matchups = []
-        # Continue until all role queues are empty
-        while role_queues[Role.IMPOSTOR] or role_queues[Role.CREWMATE]:
+        for g in range(num_games):
             lobby_setup = {} # pid -> (team, role)
             
             # 1. Fill Impostors
-            for j in range(self.config.num_impostors):
-                if role_queues[Role.IMPOSTOR]:
-                    team = role_queues[Role.IMPOSTOR].pop()
-                    lobby_setup[f"player_{j}"] = (team, Role.IMPOSTOR)
-                else:
-                    lobby_setup[f"player_{j}"] = ("__RuleBasedBot__", Role.IMPOSTOR)
+            for pid, team in zip(imp_pids, imp_pool[g * num_imp:(g + 1) * num_imp]):
+                lobby_setup[pid] = (team, Role.IMPOSTOR)
             
             # 2. Fill Crewmates
-            for j in range(self.config.num_impostors, self.config.num_players):
-                if role_queues[Role.CREWMATE]:
-                    team = role_queues[Role.CREWMATE].pop()
-                    lobby_setup[f"player_{j}"] = (team, Role.CREWMATE)
-                else:
-                    lobby_setup[f"player_{j}"] = ("__RuleBasedBot__", Role.CREWMATE)
+            for pid, team in zip(crew_pids, crew_pool[g * num_crew:(g + 1) * num_crew]):
+                lobby_setup[pid] = (team, Role.CREWMATE)
             
             matchups.append(lobby_setup)
             
@@ -80,71 +208,101 @@ class TournamentRunner:
         self.log_dir.mkdir(parents=True, exist_ok=True)
         # Use balanced matchups by default for fairness
         matchups = self.generate_balanced_matchups()
+        # Report progress ~20 times per tournament rather than once per game
+        progress_every = max(1, len(matchups) // 20)
         
-        for game_idx, lobby_setup in enumerate(matchups):
-            agents = {}
-            team_mapping = {}
-            forced_roles = {}
-            
-            for pid, (team_name, role) in lobby_setup.items():
-                if team_name == "__RuleBasedBot__":
-                    agents[pid] = RuleBasedBot()
-                else:
-                    agents[pid] = self.agent_classes[team_name]()
-                team_mapping[pid] = team_name
-                forced_roles[pid] = role
+        # Logs are encoded and written on a background thread so the next result is
+        # folded in without waiting on disk; None tells the writer to stop.
+        log_queue = queue.Queue()
+        log_failures: list[tuple[Path, Exception]] = []
+        writer = threading.Thread(target=_log_writer, args=(log_queue, log_failures), name="game-log-writer")
+        writer.start()
+        try:
+            for game_idx, result in enumerate(self._play_games(matchups)):
+                outcomes = _player_outcomes(result, result["team_mapping"])
                 
-            engine = GameEngine(self.config, agents)
-            result = engine.run(forced_roles=forced_roles)
-            result["team_mapping"] = team_mapping
-            
-            self._update_elo(result, team_mapping)
-            self._update_stats(result, team_mapping)
-            
-            log_path = self.log_dir / f"game_{game_idx:04d}.json"
-            with open(log_path, "w") as f:
-                json.dump(result, f, indent=2)
+                self._update_elo(outcomes)
+                self._update_stats(outcomes)
                 
-            self.game_results.append(result)
-            print(f"Game {game_idx+1}/{len(matchups)}: {result['winner']} wins")
+                log_queue.put((self.log_dir / f"game_{game_idx:04d}.json", result))
+                    
+                self.game_results.append(result)
+                done = game_idx + 1
+                if done % progress_every == 0 or done == len(matchups):
+                    print(f"Game {done}/{len(matchups)}: {result['winner']} wins")
+        finally:
+            log_queue.put(None)
+            writer.join()
             
+        if log_failures:
+            log_path, error = log_failures[0]
+            raise RuntimeError(f"{len(log_failures)} of {len(matchups)} game logs could not be written "
+                               f"(first: {log_path}: {error!r})") from error
         return self.get_standings()
 
-    def _update_elo(self, result: dict, team_mapping: dict) -> None:
-        winner = result["winner"]
-        for pid, team in team_mapping.items():
-            if team == "__RuleBasedBot__": continue
-            role = result["all_roles"][pid]
-            won = (role == "crewmate" and winner == "crewmates") or (role == "impostor" and winner == "impostors")
-            
-            opponents = [team_mapping[oid] for oid in team_mapping if oid != pid and team_mapping[oid] != "__RuleBasedBot__"]
-            if opponents:
-                opp_avg = sum(self.elo[t] for t in opponents) / len(opponents)
+    def _play_games(self, matchups: list[dict]):
+        """
+        Yields game results in schedule order. Games are independent, so they are
+        spread over a process pool; Elo and stats are still folded in here, in order.
+        """
+        processes = min(self.processes or os.cpu_count() or 1, len(matchups))
+        if processes <= 1:
+            _init_worker(self.agent_classes, self.config)
+            yield from map(_run_single_game, matchups)
+            return
+        # Classes travel as (module, file, qualname) refs, so this works under spawn as well as fork
+        agent_refs = {team: _class_ref(cls) for team, cls in self.agent_classes.items()}
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_pool_worker, initargs=(agent_refs, self.config)) as executor:
+            yield from executor.map(_run_single_game, matchups)
+
+    def _update_elo(self, outcomes: list[tuple[str, str, bool]]) -> None:
+        # Snapshot every seat's rating; all deltas are computed against it and applied
+        # afterwards, so opponents are rated as of the start of the game
+        ratings = [self.elo[team] for team, _, _ in outcomes]
+        # Every player's opponents are all other non-bot seats, so sum the ratings once
+        total = sum(ratings)
+        count = len(outcomes)
+        deltas = []
+        for (team, role, won), own in zip(outcomes, ratings):
+            if count > 1:
+                opp_avg = (total - own) / (count - 1)
             else:
                 opp_avg = 1200.0
                 
             k = 32 if self.stats[team]["games"] < 10 else 16
-            self.elo[team] += compute_elo_delta(self.elo[team], opp_avg, won, k)
-
-    def _update_stats(self, result: dict, team_mapping: dict) -> None:
-        winner = result["winner"]
-        for pid, team in team_mapping.items():
-            if team not in self.stats: continue
-            role = result["all_roles"][pid]
-            won = (role == "crewmate" and winner == "crewmates") or (role == "impostor" and winner == "impostors")
-            st = self.stats[team]
+            deltas.append(compute_elo_delta(own, opp_avg, won, k))
+        for (team, _, _), delta in zip(outcomes, deltas):
+            self.elo[team] += delta
+        self._standings_cache = None
+
+    def _update_stats(self, outcomes: list[tuple[str, str, bool]]) -> None:
+        self._standings_cache = None
+        stats = self.stats
+        for team, role, won in outcomes:
+            st = stats.get(team)
+            if st is None: continue
             st["games"] += 1
             if won: st["wins"] += 1
             else: st["losses"] += 1
             
-            if role == "impostor": st["games_as_impostor"] += 1
+            if role == _IMPOSTOR: st["games_as_impostor"] += 1
             else: st["games_as_crewmate"] += 1
             
             # Additional stats could be parsed from game_log, 
             # for now we'll just keep the structure ready
 
-    def get_standings(self) -> list[dict]:
-        sorted_teams = sorted(self.elo.keys(), key=lambda t: self.elo[t], reverse=True)
+    def get_standings(self, top_k: int | None = None) -> list[dict]:
+        """
+        Teams ranked by Elo. The full table is cached until the next game is folded in;
+        a top_k request against stale ratings only partially sorts for the leaders.
+        """
+        if self._standings_cache is None and top_k is not None:
+            return self._build_standings(heapq.nlargest(top_k, self.elo, key=self.elo.__getitem__))
+        if self._standings_cache is None:
+            self._standings_cache = self._build_standings(sorted(self.elo, key=self.elo.__getitem__, reverse=True))
+        return self._standings_cache[:top_k]
+
+    def _build_standings(self, sorted_teams: list[str]) -> list[dict]:
         standings = []
         for rank, team in enumerate(sorted_teams):
             st = self.stats[team]
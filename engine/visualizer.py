@@ -47,6 +47,7 @@ class AmongUsVisualizer:
         self.root.geometry("1200x800")
         
         self.game_data = None
+        self._meetings_by_round = {}
         self.current_round = 0
         self.max_rounds = 0
         
@@ -110,6 +111,9 @@ class AmongUsVisualizer:
         with open(filename, "r") as f:
             self.game_data = json.load(f)
             
+        self._meetings_by_round = {}
+        for m in self.game_data.get("meeting_history", []):
+            self._meetings_by_round.setdefault(m["round_called"], []).append(m)
         self.max_rounds = len(self.game_data.get("game_log", [])) - 1
         self.current_round = 0
         self.file_label.config(text=Path(filename).name)
@@ -208,9 +212,8 @@ class AmongUsVisualizer:
 
         # Update Chat Transcript
         self.chat_txt.delete(1.0, tk.END)
-        meetings = self.game_data.get("meeting_history", [])
         # Look for meeting matching this exact round number
-        current_meetings = [m for m in meetings if m["round_called"] == r_num]
+        current_meetings = self._meetings_by_round.get(r_num, [])
         
         if current_meetings:
             for m in current_meetings:
@@ -1,12 +1,18 @@
 import os
 import json
-import requests
 import logging
 from engine.engine import BaseAgent, Role
-from engine.agents import parse_llm_json, format_observation_as_text
+from engine.agents import parse_llm_json, format_observation_as_text, create_http_session, encode_payload, ChatHistoryBuffer, parse_llm_vote, ResponseCache
 from dotenv import load_dotenv
 load_dotenv()  
 
+# One pooled keep-alive session for every agent in this process
+_SESSION = create_http_session()
+_SESSION.headers.update({
+    "HTTP-Referer": "https://github.com/goelanmol124/EightFold_Amongus", # Optional but recommended by OpenRouter
+    "X-Title": "ARIES Simulation" # Optional but recommended
+})
+
 # --- OpenRouter Utilities ---
 
 class OpenRouterWrapper:
@@ -20,16 +26,18 @@ class OpenRouterWrapper:
         
         if not self.api_key:
             raise ValueError("Environment variable OPENROUTER_API_KEY not found.")
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._cache = ResponseCache()
 
-    def call(self, system_prompt: str, user_message: str, max_tokens: int = 500, json_mode: bool = False) -> str:
-        url = "https://openrouter.ai/api/v1/chat/completions"
+    def call(self, system_prompt: str, user_message: str, max_tokens: int = 500, json_mode: bool = False, cache: bool = False) -> str:
+        # cache=True reuses the reply to an identical earlier request (sent at temperature 0)
+        if cache:
+            key = ResponseCache.key(self.model_name, max_tokens, json_mode, system_prompt, user_message)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/goelanmol124/EightFold_Amongus", # Optional but recommended by OpenRouter
-            "X-Title": "ARIES Simulation" # Optional but recommended
-        }
+        url = "https://openrouter.ai/api/v1/chat/completions"
         
         data = {
             "model": self.model_name,
@@ -38,7 +46,7 @@ class OpenRouterWrapper:
                 {"role": "user", "content": user_message}
             ],
             "max_tokens": max_tokens,
-            "temperature": 0.7
+            "temperature": 0.0 if cache else 0.7
         }
 
         # Force JSON output for models that support it
@@ -46,10 +54,17 @@ class OpenRouterWrapper:
             data["response_format"] = {"type": "json_object"}
         
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            response = _SESSION.post(url, headers=self.headers, data=encode_payload(data), timeout=30)
             if response.status_code == 200:
                 # OpenRouter returns standard OpenAI-style JSON
-                return response.json().get("choices", [{}])[0].get("message", {}).get("content", "")
+                try:
+                    content = json.loads(response.content)["choices"][0]["message"]["content"] or ""
+                except (ValueError, KeyError, IndexError, TypeError):
+                    logging.error(f"OpenRouter returned an unexpected payload: {response.text}")
+                    return ""
+                if cache and content:
+                    self._cache.put(key, content)
+                return content
             else:
                 logging.error(f"OpenRouter API Error ({response.status_code}): {response.text}")
                 return ""
@@ -57,13 +72,45 @@ class OpenRouterWrapper:
             logging.error(f"OpenRouter Call failed: {e}")
             return ""
 
+    def call_batch(self, system_prompt: str, user_messages: list[str], max_tokens: int = 500) -> list[str]:
+        """
+        Answers several independent observations with a single request.
+        Returns one JSON action string per message ("" if the model skipped it).
+        """
+        n = len(user_messages)
+        blocks = "\n\n".join(f"[{i + 1}]\n{msg}" for i, msg in enumerate(user_messages))
+        user_message = f'Answer each of the following {n} independent observations. Respond with a JSON object {{"actions": [...]}} holding {n} action objects, in order.\n\n{blocks}'
+        
+        resp = self.call(system_prompt, user_message, max_tokens=max_tokens * n, json_mode=True)
+        parsed = parse_llm_json(resp, {})
+        # Accept the requested {"actions": [...]} as well as a bare array of actions
+        actions = parsed.get("actions") if isinstance(parsed, dict) else parsed
+        if not isinstance(actions, list):
+            actions = []
+        replies = [json.dumps(a) if isinstance(a, dict) else "" for a in actions[:n]]
+        return replies + [""] * (n - len(replies))
+
 # --- The Personality Agent ---
 
+_STRATEGY_PROMPT = """STRATEGY:
+- Crew: do tasks; report bodies.
+- Impostor: predict movement to catch targets alone. NEVER kill your "teammates".
+- Meetings: be logical; skipping at 4-5 alive is dangerous; vote the most suspicious.
+- Ghost: move to your tasks and finish them.
+FORMAT: task phase -> JSON {"action": "move"|"do_task"|..., "target": ...}; do_task target is the exact [ID: ...] string, never the task name. Discussion -> plain text. Vote -> player ID or "skip"."""
+
+# Shared by every seat in a batch, so it carries no identity; each observation block states its own
+_BATCH_SYSTEM_PROMPT = f"""Among Us. You choose actions for several players. Each numbered observation says which player you are, your role and personality; answer it from that observation alone.
+{_STRATEGY_PROMPT}"""
+
 class OpenRouterPersonalityAgent(BaseAgent):
     """
     An optimized agent that uses OpenRouter.
     Includes a specific personality and strategic instructions.
     """
+    # Past ~8 observations per request the reply quality drops faster than the overhead saved
+    BATCH_SIZE_LIMIT = 8
+
     def __init__(self, personality="The Analytical Detective: Logical, tracks movements, suspicious of alibis.", model_name="upstage/solar-pro-3:free"):
         try:
             self.llm = OpenRouterWrapper(model_name=model_name)
@@ -75,69 +122,110 @@ class OpenRouterPersonalityAgent(BaseAgent):
         self.personality = personality
         self.id = ""
         self.role = ""
+        self.discussion_rotations = 3
+        # Vote decided together with the last discussion message of a meeting
+        self._cached_plan = None
+        self._chat = ChatHistoryBuffer()
+        self._system_prompt = self._get_system_prompt()
 
     def on_game_start(self, config):
         self.id = config["your_id"]
         self.role = config["your_role"]
+        self.discussion_rotations = config.get("config", {}).get("discussion_rotations", self.discussion_rotations)
+        self._cached_plan = None
+        self._system_prompt = self._get_system_prompt()
 
     def _get_system_prompt(self):
-        return f"""You are playing 'Among Us' as {self.id}, a {self.role}.
+        return f"""Among Us. You are {self.id}, {self.role}.
 PERSONALITY: {self.personality}
-
-STRATEGY:
-- Crewmate: Prioritize tasks. If you see a body, report it.
-- Impostor: To kill someone, predict where they will move next. CRITICAL: Check your observation for your "teammates". NEVER try to kill your teammate.
-- DISCUSSION: Be logical. If there are 4-5 players left, SKIPPING is dangerous. Vote for the most suspicious person.
-- GHOSTS: If dead, your ONLY goal is to move to your task locations and finish them.
-
-RESPONSE FORMAT:
-- During TASK phase: Respond with a JSON object. 
-  - To move: {{"action": "move", "target": "Admin"}}
-  - To do a task: {{"action": "do_task", "target": "task_id_here"}} (CRITICAL: You MUST use the exact string inside the [ID: ...] brackets. NEVER use the human-readable task name).
-- During DISCUSSION: Respond with plain text conversational message.
-- During VOTING: Respond with player ID or "skip"."""
+{_STRATEGY_PROMPT}"""
 
     def on_task_phase(self, obs):
+        self._cached_plan = None
         if not self.llm_available:
             return {"action": "wait"}
             
-        prompt = self._get_system_prompt()
+        prompt = self._system_prompt
         obs_text = format_observation_as_text(obs)
         
         state_note = ""
         if "available_actions" not in obs:
-            state_note = "\nNOTE: You are a GHOST (dead). Focus on tasks."
+            state_note = "\nYou are a GHOST: focus on tasks."
         
-        user_msg = f"CURRENT OBSERVATION:\n{obs_text}{state_note}\n\nWhat is your next action? Respond ONLY with JSON. If doing a task, use the EXACT ID provided in the brackets, not the name."
+        # json_mode already forces a JSON object, so the turn message stays minimal
+        user_msg = f"{obs_text}{state_note}\nNext action?"
         
         resp = self.llm.call(prompt, user_msg, json_mode=True)
         return parse_llm_json(resp, {"action": "wait"})
 
+    @classmethod
+    def batch_on_task_phase(cls, agents: list["OpenRouterPersonalityAgent"], observations: list[dict]) -> list[dict]:
+        """
+        Picks task-phase actions for several seats driven by the same model, one LLM
+        request per BATCH_SIZE_LIMIT seats instead of one per seat. The engine still
+        calls on_task_phase per player; this is for harnesses that control several
+        seats themselves. All observations share one context, so only batch seats
+        that may see each other's view (e.g. the same team in self-play).
+        """
+        actions = []
+        seats = list(zip(agents, observations))
+        for start in range(0, len(seats), cls.BATCH_SIZE_LIMIT):
+            batch = seats[start:start + cls.BATCH_SIZE_LIMIT]
+            lead = batch[0][0]
+            if not lead.llm_available:
+                actions.extend({"action": "wait"} for _ in batch)
+                continue
+            # The observation text opens with "You are <id> (<role>)", so each block is self-identifying
+            user_msgs = [f"{format_observation_as_text(obs)}\nPERSONALITY: {agent.personality}" for agent, obs in batch]
+            replies = lead.llm.call_batch(_BATCH_SYSTEM_PROMPT, user_msgs)
+            actions.extend(parse_llm_json(r, {"action": "wait"}) for r in replies)
+        return actions
+
     def on_discussion(self, obs):
         if not self.llm_available:
             return "I am a robot and my LLM is offline."
             
-        prompt = self._get_system_prompt()
-        obs_text = format_observation_as_text(obs)
-        chat_hist = "\n".join([f"{m['speaker']}: {m['message']}" for m in obs.get("chat_history", [])])
-        user_msg = f"MEETING CONTEXT: {obs.get('meeting_context')}\n\nCHAT HISTORY:\n{chat_hist}\n\nIt is your turn. Be concise."
+        prompt = self._system_prompt
+        chat = obs.get("chat_history", [])
+        chat_hist = self._chat.render(obs)
+        alive = obs.get("players", {}).get("alive", [])
+        
+        # Only the meeting's last speaker has heard everything the vote depends on;
+        # everyone else votes with a separate request after the discussion
+        if len(chat) != self.discussion_rotations * len(alive) - 1:
+            self._cached_plan = None
+            user_msg = f"MEETING CONTEXT: {obs.get('meeting_context')}\n\nCHAT HISTORY:\n{chat_hist}\n\nIt is your turn. Be concise."
+            return self.llm.call(prompt, user_msg)
         
-        return self.llm.call(prompt, user_msg)
+        # Last message of the meeting: decide the vote in the same request, saving
+        # the separate voting round-trip
+        user_msg = f'MEETING CONTEXT: {obs.get("meeting_context")}\n\nCHAT HISTORY:\n{chat_hist}\n\nThis is your final message before voting. Be concise. Respond as JSON: {{"message": "...", "vote": "<player ID or skip>"}}'
+        plan = parse_llm_json(self.llm.call(prompt, user_msg, json_mode=True), {})
+        vote = plan.get("vote")
+        self._cached_plan = {"vote": str(vote)} if vote else None
+        return str(plan.get("message", ""))
 
     def on_vote(self, obs):
         if not self.llm_available:
             return "skip"
+        
+        if self._cached_plan:
+            return parse_llm_vote(self._cached_plan.pop("vote"))
             
-        prompt = self._get_system_prompt()
-        chat_hist = "\n".join([f"{m['speaker']}: {m['message']}" for m in obs.get("chat_history", [])])
+        prompt = self._system_prompt
+        chat_hist = self._chat.render(obs)
         user_msg = f"CHAT HISTORY:\n{chat_hist}\n\nWho do you vote for? Respond with Player ID or 'skip'."
         
-        resp = self.llm.call(prompt, user_msg)
-        if not resp: return "skip"
-        return resp.strip().split()[-1].replace('"', '').replace("'", "")
+        return parse_llm_vote(self.llm.call(prompt, user_msg))
 
     def on_game_end(self, result):
         pass
 
+    def reset(self):
+        self.id = ""
+        self.role = ""
+        self._cached_plan = None
+        self._chat = ChatHistoryBuffer()
+
 # Hook for the engine
 Agent = OpenRouterPersonalityAgent
\ No newline at end of file
@@ -1,8 +1,14 @@
 import random
 from engine.engine import BaseAgent
-from engine.config import MAP_ADJACENCY
+from engine.config import MAP_ADJACENCY, ALL_ROOMS
 from engine.agents import bfs_shortest_path
 
+# The map is static, so the first step of every shortest path is computed once: _NEXT_HOP[src][dst]
+_NEXT_HOP = {
+    src: {dst: path[1] for dst in ALL_ROOMS if len(path := bfs_shortest_path(src, dst, MAP_ADJACENCY)) > 1}
+    for src in ALL_ROOMS
+}
+
 class SimpleRuleBasedAgent(BaseAgent):
     """
     A strategic non-LLM bot that follows a simple rule-set:
@@ -16,7 +22,8 @@ class SimpleRuleBasedAgent(BaseAgent):
         self.tasks = config.get("tasks", [])
 
     def on_task_phase(self, obs):
-        avail = obs.get("available_actions", {})
+        avail = obs.get("available_actions") or {}
+        room_obs = obs.get("room_observations") or {}
         loc = obs["identity"]["your_location"]
         
         # 1. Always report if possible
@@ -25,22 +32,24 @@ class SimpleRuleBasedAgent(BaseAgent):
             
         # 2. Handle roles
         if self.role == "crewmate":
-            # Do task if in room
-            tasks = obs.get("tasks", {}).get("your_tasks", [])
-            for t in tasks:
-                if t["location"] == loc and t["progress"] < t["required"]:
-                    return {"action": "do_task", "target": t["id_to_use"]}
+            # Do task if in room, otherwise remember the first incomplete one
+            first_pending = None
+            for t in (obs.get("tasks") or {}).get("your_tasks") or ():
+                if t["progress"] < t["required"]:
+                    if t["location"] == loc:
+                        return {"action": "do_task", "target": t["id_to_use"]}
+                    if first_pending is None:
+                        first_pending = t
             
-            # Otherwise move toward first incomplete task
-            pending = [t for t in tasks if t["progress"] < t["required"]]
-            if pending:
-                path = bfs_shortest_path(loc, pending[0]["location"], MAP_ADJACENCY)
-                if len(path) > 1:
-                    return {"action": "move", "target": path[1]}
+            # Move toward first incomplete task
+            if first_pending:
+                next_room = _NEXT_HOP.get(loc, {}).get(first_pending["location"])
+                if next_room:
+                    return {"action": "move", "target": next_room}
         
         else: # Impostor
             if avail.get("can_kill"):
-                players = obs.get("room_observations", {}).get("players_present", [])
+                players = room_obs.get("players_present", [])
                 if len(players) == 1: # Kill if alone
                     return {"action": "kill", "target": players[0]["id"]}
             
@@ -48,7 +57,7 @@ class SimpleRuleBasedAgent(BaseAgent):
                 return {"action": "sabotage", "target": "reactor"}
                 
         # Random move if nothing else to do
-        adj = obs.get("room_observations", {}).get("adjacent_rooms", [])
+        adj = room_obs.get("adjacent_rooms", [])
         if adj:
             return {"action": "move", "target": random.choice(adj)}
             
@@ -62,3 +71,6 @@ class SimpleRuleBasedAgent(BaseAgent):
 
     def on_game_end(self, result):
         pass
+
+    def reset(self):
+        pass
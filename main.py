@@ -1,5 +1,8 @@
 import argparse
+import sys
 import json
+import dataclasses
+import hashlib
 import importlib.util
 from pathlib import Path
 
@@ -8,25 +11,42 @@ from engine.engine import GameEngine, BaseAgent
 from engine.tournament import TournamentRunner
 from engine.agents import RandomBot, RuleBasedBot
 
+# Resolved path -> agent class, so each agent file is executed once per process
+_AGENT_CLASS_CACHE: dict[str, type] = {}
+
 def load_agent_class(path: str) -> type:
     if path == "random": return RandomBot
     if path == "rulebased": return RuleBasedBot
     
-    spec = importlib.util.spec_from_file_location("agent", path)
+    key = str(Path(path).resolve())
+    if key in _AGENT_CLASS_CACHE:
+        return _AGENT_CLASS_CACHE[key]
+    
+    # A registered module name unique to the resolved path lets tournament workers re-import the class
+    module_name = f"agent_{Path(path).stem}_{hashlib.blake2b(key.encode(), digest_size=6).hexdigest()}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
     if not spec or not spec.loader:
         print(f"Warning: Failed to load {path}, falling back to RuleBasedBot")
         return RuleBasedBot
         
     module = importlib.util.module_from_spec(spec)
     try:
+        sys.modules[module_name] = module
         spec.loader.exec_module(module)
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if isinstance(attr, type) and issubclass(attr, BaseAgent) and attr is not BaseAgent:
-                return attr
+        # An explicit `Agent = MyAgentClass` hook (as in examples/) wins over scanning
+        agent_class = getattr(module, "Agent", None)
+        if not (isinstance(agent_class, type) and issubclass(agent_class, BaseAgent) and agent_class is not BaseAgent):
+            candidates = [v for v in vars(module).values()
+                          if isinstance(v, type) and issubclass(v, BaseAgent) and v is not BaseAgent]
+            # Prefer a class defined in the file over one it merely imports (e.g. RuleBasedBot)
+            agent_class = next((c for c in candidates if c.__module__ == module.__name__), None) or next(iter(candidates), None)
+        if agent_class is not None:
+            _AGENT_CLASS_CACHE[key] = agent_class
+            return agent_class
     except Exception as e:
         print(f"Warning: Exception {e} loading {path}, falling back to RuleBasedBot")
         
+    sys.modules.pop(module_name, None)
     print(f"Warning: No BaseAgent subclass found in {path}, falling back to RuleBasedBot")
     return RuleBasedBot
 
@@ -47,6 +67,7 @@ def main():
     tourney_parser.add_argument("--games", type=int, default=1, help="Games per team")
     tourney_parser.add_argument("--config", type=str, help="Path to JSON config override")
     tourney_parser.add_argument("--output-dir", type=str, default="match_history", help="Directory for logs and standings")
+    tourney_parser.add_argument("--parallel", type=int, default=None, help="Worker processes for running games (default: CPU count, 1 = sequential)")
 
     # Visualizer command
     viz_parser = subparsers.add_parser("visualize", help="Launch the basic tkinter visualizer")
@@ -73,13 +94,13 @@ def main():
         theater.run_theater()
         return
 
-    config = GameConfig()
+    # Overrides are read once into the base config; per-run tweaks go through dataclasses.replace
+    overrides = {}
     if args.config:
         with open(args.config, "r") as f:
-            overrides = json.load(f)
-            for k, v in overrides.items():
-                if hasattr(config, k):
-                    setattr(config, k, v)
+            known = {field.name for field in dataclasses.fields(GameConfig)}
+            overrides = {k: v for k, v in json.load(f).items() if k in known}
+    config = GameConfig(**overrides)
 
     if args.command == "play":
         agent_instances = {}
@@ -87,16 +108,17 @@ def main():
             agent_class = load_agent_class(p)
             agent_instances[f"player_{i}"] = agent_class()
             
-        config.num_players = len(agent_instances)
+        config = dataclasses.replace(config, num_players=len(agent_instances))
         # Ensure num_impostors is valid for the selected number of players
         if config.num_impostors >= config.num_players / 2:
-            config.num_impostors = max(1, int((config.num_players - 1) // 2))
+            config = dataclasses.replace(config, num_impostors=max(1, int((config.num_players - 1) // 2)))
             
         engine = GameEngine(config, agent_instances)
         result = engine.run(verbose=args.verbose)
         print(f"Game Over! Winner: {result['winner']} (Cause: {result['cause']})")
         
-        with open(args.output, "w") as f:
+        # json.dump streams the indented log in chunks; a large buffer turns them into a few big writes
+        with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as f:
             json.dump(result, f, indent=2)
         print(f"Game log saved to {args.output}")
 
@@ -111,7 +133,7 @@ def main():
             print(f"Error: Directory {args.agents_dir} not found.")
             return
 
-        runner = TournamentRunner(agent_classes, config, games_per_team=args.games, log_dir=args.output_dir)
+        runner = TournamentRunner(agent_classes, config, games_per_team=args.games, log_dir=args.output_dir, processes=args.parallel)
         standings = runner.run_tournament()
         
         print("\n=== TOURNAMENT STANDINGS ===")
@@ -58,3 +58,12 @@ class MyHackathonAgent(BaseAgent):
         :param result: Dict containing the winner and game stats.
         """
         print(f"Game Over! Winner: {result['winner']}")
+
+    # Optional: uncomment to let tournaments reuse this instance across games instead of
+    # constructing a fresh one each time. Only do so once it clears EVERY attribute you
+    # add (memory, chat logs, plans); anything it misses leaks into the next game.
+    #
+    # def reset(self) -> None:
+    #     self.id = ""
+    #     self.role = ""
+    #     self.game_config = {}